@@ -1,19 +1,37 @@
+import atexit
+import html
+import json
 import os
+import queue
+import re
 import sqlite3
-from datetime import datetime
-from functools import wraps
-from io import BytesIO
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from itertools import count, islice
 from urllib.parse import urlencode
+from zipfile import ZIP_DEFLATED, ZipFile
 
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import click
+import openpyxl
+from openpyxl.writer.excel import ExcelWriter
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import redis
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from flask_session import Session
 from flask import (
     Flask,
     abort,
     flash,
+    g,
     redirect,
     render_template,
     request,
@@ -26,6 +44,7 @@ from werkzeug.security import check_password_hash, generate_password_hash
 APP_DIR = os.path.abspath(os.path.dirname(__file__))
 DB_PATH = os.path.join(APP_DIR, "data", "influencers.db")
 DATABASE_URL = os.environ.get("DATABASE_URL", "").strip()
+REDIS_URL = os.environ.get("REDIS_URL", "").strip()
 COLUMN_LABELS = {
     "influencer_id": "인플루언서ID",
     "platform": "플랫폼",
@@ -49,22 +68,302 @@ COLUMN_LABELS = {
     "dm_message": "DM문구",
     "notes": "비고",
 }
+IMPORT_COLUMN_MAP = {
+    "인플루언서ID": "influencer_id",
+    "플랫폼": "platform",
+    "카테고리(대)": "category_main",
+    "카테고리(소)": "category_sub",
+    "이름/계정명": "account_name",
+    "프로필URL": "profile_url",
+    "인스타그램아이디": "instagram_username",
+    "컨택이메일": "contact_email",
+    "에이전시/소속": "agency",
+    "팔로워/구독자(원본)": "followers_raw",
+    "팔로워/구독자(숫자)": "followers_num",
+    "팔로워 구간": "follower_range",
+    "영상 활용도(高/中/低)": "video_usage",
+    "2030 타깃 적합도(1~5)": "target_2030_score",
+    "단가_BDC": "price_bdc",
+    "단가_PPL": "price_ppl",
+    "단가_Short/Shorts": "price_short",
+    "단가_IG": "price_ig",
+    "썸네일": "thumbnail_url",
+    "DM문구": "dm_message",
+    "비고": "notes",
+    "계정명": "account_name",
+    "카테고리": "category_main",
+    "주요 콘텐츠": "category_sub",
+    "감성 키워드": "notes",
+}
 DEFAULT_DISCOVER_LIMIT = 10
+PAGE_SIZE = 50
+MAX_PAGE = (2**63 - 1) // PAGE_SIZE
+LISTING_COLUMNS = (
+    "id",
+    "account_name",
+    "platform",
+    "profile_url",
+    "instagram_username",
+    "dm_message",
+)
+IMPORT_PAGE_SIZE = 500
+IMPORT_CHUNK_SIZE = 1000
+EXPORT_CHUNK_SIZE = 5000
+EXPORT_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+EXPORT_COMPRESS_LEVEL = 1
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+INT_COLUMNS = frozenset({"followers_num", "target_2030_score"})
+COLUMNS = tuple(COLUMN_LABELS)
+INSERT_SQL = (
+    f"INSERT INTO influencers ({', '.join(COLUMNS)}, created_at, updated_at) VALUES "
+)
+INSERT_ROW_PLACEHOLDERS = f"({', '.join(['?'] * (len(COLUMNS) + 2))})"
+UPSERT_SQL = f"""
+    INSERT INTO influencers (id, {", ".join(COLUMNS)}, created_at, updated_at)
+    VALUES ({{id_value}}, {", ".join(["?"] * (len(COLUMNS) + 2))})
+    ON CONFLICT (id) DO UPDATE SET
+        {", ".join(f"{col} = EXCLUDED.{col}" for col in COLUMNS + ("updated_at",))}
+    RETURNING id
+"""
+PG_POOL_MAX_CONN = int(os.environ.get("DB_POOL_MAX", "10"))
+PG_POOL_MIN_CONN = int(os.environ.get("DB_POOL_MIN", PG_POOL_MAX_CONN))
+PG_POOL_TIMEOUT = 30
+SQLITE_POOL_SIZE = 8
+THUMBNAIL_FETCH_WORKERS = 32
+THUMBNAIL_BACKFILL_WORKERS = 8
+FILTER_COLUMNS = ("platform", "category_main", "category_sub")
+FILTER_OPTIONS_KEY = "filter_options"
+FILTER_OPTIONS_TTL = 60
+LOCAL_CACHE_MAX_ENTRIES = 1024
+USER_CACHE_TTL = 300
+PASSWORD_HASH_METHOD = "pbkdf2:sha256:150000"
+DISCOVER_CACHE_TTL = 600
+THUMBNAIL_CACHE_TTL = 7 * 24 * 3600
+SEARCH_COLUMNS = (
+    "influencer_id",
+    "account_name",
+    "platform",
+    "category_main",
+    "category_sub",
+    "profile_url",
+    "instagram_username",
+    "contact_email",
+    "agency",
+    "follower_range",
+    "dm_message",
+    "notes",
+)
+INDEX_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS ix_inf_updated ON influencers(updated_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_inf_filter "
+    "ON influencers(platform, category_main, category_sub, updated_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_inf_category "
+    "ON influencers(category_main, category_sub, updated_at DESC)",
+)
+PG_SEARCH_EXPR = " || ' ' || ".join(f"coalesce({col}, '')" for col in SEARCH_COLUMNS)
+PG_SEARCH_INDEX_STATEMENTS = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_inf_search_trgm "
+    f"ON influencers USING gin (({PG_SEARCH_EXPR}) gin_trgm_ops)",
+)
+SQLITE_FTS_ENABLED = sqlite3.sqlite_version_info >= (3, 34, 0)
+FTS_MIN_QUERY_LENGTH = 3
+OG_IMAGE_TAG_RE = re.compile(
+    rb"""<meta\b[^>]*\bproperty\s*=\s*["']og:image["'][^>]*>""", re.IGNORECASE
+)
+META_CONTENT_RE = re.compile(rb"""\bcontent\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+YOUTUBE_VIDEO_ID_RE = re.compile(r"(?:watch\?v=|youtu\.be/|/shorts/)([A-Za-z0-9_-]{6,})")
+INSTAGRAM_USERNAME_RE = re.compile(r"instagram\.com/+([^/?#]+)")
+INSTAGRAM_RESERVED_PATHS = frozenset({"p", "reel", "tv", "stories", "explore"})
+SQLITE_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
 
 
-def get_db():
-    if DATABASE_URL:
-        db_url = DATABASE_URL
-        if "sslmode=" not in db_url:
-            joiner = "&" if "?" in db_url else "?"
-            db_url = f"{db_url}{joiner}sslmode=require"
-        conn = psycopg2.connect(db_url, cursor_factory=RealDictCursor)
-        return conn, True
-    conn = sqlite3.connect(DB_PATH)
+def postgres_dsn():
+    db_url = DATABASE_URL
+    if "sslmode=" not in db_url:
+        joiner = "&" if "?" in db_url else "?"
+        db_url = f"{db_url}{joiner}sslmode=require"
+    return db_url
+
+
+PG_POOL = (
+    ThreadedConnectionPool(
+        PG_POOL_MIN_CONN,
+        PG_POOL_MAX_CONN,
+        postgres_dsn(),
+        cursor_factory=RealDictCursor,
+        keepalives=1,
+        keepalives_idle=30,
+        keepalives_interval=10,
+        keepalives_count=5,
+    )
+    if DATABASE_URL
+    else None
+)
+PG_POOL_SLOTS = threading.BoundedSemaphore(PG_POOL_MAX_CONN)
+SQLITE_POOL = queue.LifoQueue(maxsize=SQLITE_POOL_SIZE)
+PREPARED_STATEMENTS = weakref.WeakKeyDictionary()
+EXECUTOR = ThreadPoolExecutor(max_workers=THUMBNAIL_BACKFILL_WORKERS)
+REDIS = redis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+LOCAL_CACHE = {}
+LOCAL_CACHE_LOCK = threading.Lock()
+HTTP = requests.Session()
+for prefix in ("https://", "http://"):
+    HTTP.mount(
+        prefix,
+        HTTPAdapter(
+            pool_connections=THUMBNAIL_FETCH_WORKERS,
+            pool_maxsize=THUMBNAIL_FETCH_WORKERS,
+        ),
+    )
+API_HTTP = requests.Session()
+API_HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+
+
+def connect_sqlite():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def acquire_db():
+    if PG_POOL is not None:
+        if not PG_POOL_SLOTS.acquire(timeout=PG_POOL_TIMEOUT):
+            raise PoolError("connection pool exhausted")
+        try:
+            conn = PG_POOL.getconn()
+            while conn.closed:
+                PG_POOL.putconn(conn, close=True)
+                conn = PG_POOL.getconn()
+        except Exception:
+            PG_POOL_SLOTS.release()
+            raise
+        return conn, True
+    try:
+        conn = SQLITE_POOL.get_nowait()
+    except queue.Empty:
+        conn = connect_sqlite()
     return conn, False
 
 
+def release_db(conn, is_postgres):
+    if is_postgres:
+        try:
+            PG_POOL.putconn(conn)
+        finally:
+            PG_POOL_SLOTS.release()
+        return
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        SQLITE_POOL.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+def checkpoint_sqlite():
+    conn, _ = acquire_db()
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        release_db(conn, False)
+
+
+def get_db():
+    if "db" not in g:
+        g.db = acquire_db()
+    return g.db
+
+
+def close_db(exc=None):
+    db = g.pop("db", None)
+    if db is not None:
+        release_db(*db)
+
+
+def cache_get(key):
+    if REDIS is not None:
+        try:
+            value = REDIS.get(key)
+        except redis.RedisError:
+            return None
+        return json.loads(value) if value is not None else None
+    with LOCAL_CACHE_LOCK:
+        entry = LOCAL_CACHE.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def cache_set(key, value, ttl):
+    if REDIS is not None:
+        try:
+            REDIS.setex(key, ttl, json.dumps(value))
+        except redis.RedisError:
+            pass
+        return
+    now = time.monotonic()
+    with LOCAL_CACHE_LOCK:
+        if len(LOCAL_CACHE) >= LOCAL_CACHE_MAX_ENTRIES:
+            for stale_key in [k for k, (expires, _) in LOCAL_CACHE.items() if expires < now]:
+                del LOCAL_CACHE[stale_key]
+        if len(LOCAL_CACHE) >= LOCAL_CACHE_MAX_ENTRIES:
+            del LOCAL_CACHE[next(iter(LOCAL_CACHE))]
+        LOCAL_CACHE[key] = (now + ttl, value)
+
+
+def cache_delete(*keys):
+    if REDIS is not None:
+        try:
+            REDIS.delete(*keys)
+        except redis.RedisError:
+            pass
+        return
+    with LOCAL_CACHE_LOCK:
+        for key in keys:
+            LOCAL_CACHE.pop(key, None)
+
+
+def cached_search(platform, ttl):
+    def decorator(search_fn):
+        @wraps(search_fn)
+        def wrapped(query, limit, use_cache=True):
+            key = f"discover:{platform}:{limit}:{query.lower()}"
+            if use_cache:
+                result = cache_get(key)
+                if result is not None:
+                    return result
+            result = search_fn(query, limit)
+            if not result["error"]:
+                cache_set(key, result, ttl)
+            return result
+
+        return wrapped
+
+    return decorator
+
+
+@lru_cache(maxsize=1)
+def utc_date(minute):
+    return datetime.now(timezone.utc).date().isoformat()
+
+
 def format_query(query, is_postgres):
     if not is_postgres:
         return query
@@ -80,7 +379,7 @@ def run_query(conn, is_postgres, query, params=None, fetch_one=False, fetch_all=
         return cursor.fetchone()
     if fetch_all:
         return cursor.fetchall()
-    return None
+    return cursor.rowcount
 
 
 def init_db():
@@ -212,6 +511,18 @@ def init_db():
                 is_postgres,
                 f"ALTER TABLE influencers ADD COLUMN {col} {col_type}",
             )
+    for statement in INDEX_STATEMENTS:
+        run_query(conn, is_postgres, statement)
+    if is_postgres:
+        conn.commit()
+        try:
+            for statement in PG_SEARCH_INDEX_STATEMENTS:
+                run_query(conn, is_postgres, statement)
+            conn.commit()
+        except psycopg2.Error:
+            conn.rollback()
+    elif SQLITE_FTS_ENABLED:
+        init_sqlite_search(conn)
     user = run_query(
         conn,
         is_postgres,
@@ -224,23 +535,141 @@ def init_db():
             conn,
             is_postgres,
             "INSERT INTO users (username, password_hash) VALUES (?, ?)",
-            ("spler", generate_password_hash("spler123")),
+            ("spler", generate_password_hash("spler123", method=PASSWORD_HASH_METHOD)),
         )
     conn.commit()
-    conn.close()
+
+
+def run_prepared(conn, is_postgres, name, query, params, fetch_one=False):
+    if not is_postgres:
+        return run_query(conn, is_postgres, query, params, fetch_one=fetch_one)
+    prepared = PREPARED_STATEMENTS.setdefault(conn, set())
+    cursor = conn.cursor()
+    if name not in prepared:
+        placeholders = count(1)
+        cursor.execute(
+            f"PREPARE {name} AS "
+            + re.sub(r"\?", lambda _: f"${next(placeholders)}", query)
+        )
+        prepared.add(name)
+    cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    if fetch_one:
+        return cursor.fetchone()
+    return cursor.rowcount
+
+
+def run_query_iter(
+    conn, is_postgres, query, params=None, chunk_size=EXPORT_CHUNK_SIZE, header=False
+):
+    params = params or ()
+    q = format_query(query, is_postgres)
+    if is_postgres:
+        cursor = conn.cursor(
+            name="stream_cursor", cursor_factory=psycopg2.extensions.cursor
+        )
+    else:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+    try:
+        cursor.execute(q, params)
+        rows = cursor.fetchmany(chunk_size)
+        if header:
+            yield tuple(col[0] for col in cursor.description)
+        while rows:
+            yield from rows
+            rows = cursor.fetchmany(chunk_size)
+    finally:
+        cursor.close()
+
+
+def init_sqlite_search(conn):
+    columns = ", ".join(SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{col}" for col in SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{col}" for col in SEARCH_COLUMNS)
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'influencers_fts'"
+    ).fetchone()
+    conn.execute(
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS influencers_fts USING fts5(
+            {columns},
+            content='influencers',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS influencers_fts_ai AFTER INSERT ON influencers BEGIN
+            INSERT INTO influencers_fts (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS influencers_fts_ad AFTER DELETE ON influencers BEGIN
+            INSERT INTO influencers_fts (influencers_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS influencers_fts_au AFTER UPDATE ON influencers BEGIN
+            INSERT INTO influencers_fts (influencers_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO influencers_fts (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+        """
+    )
+    if not exists:
+        conn.execute("INSERT INTO influencers_fts (influencers_fts) VALUES ('rebuild')")
 
 
 def create_app():
     app = Flask(__name__)
     app.config["SECRET_KEY"] = os.environ.get("FLASK_SECRET_KEY", "dev-secret")
+    if REDIS is not None:
+        app.config["SESSION_TYPE"] = "redis"
+        app.config["SESSION_REDIS"] = REDIS
+        app.config["SESSION_PERMANENT"] = False
+        Session(app)
+    app.teardown_appcontext(close_db)
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    init_db()
+    with app.app_context():
+        init_db()
+    if PG_POOL is None:
+        atexit.register(checkpoint_sqlite)
+
+    def cache_user(user):
+        user = {"id": user["id"], "username": user["username"]}
+        cache_set(f"user:{user['id']}", user, USER_CACHE_TTL)
+        return user
+
+    def load_user(user_id):
+        user = cache_get(f"user:{user_id}")
+        if user is not None:
+            return user
+        conn, is_postgres = get_db()
+        user = run_query(
+            conn,
+            is_postgres,
+            "SELECT id, username FROM users WHERE id = ?",
+            (user_id,),
+            fetch_one=True,
+        )
+        return cache_user(user) if user else None
 
     def login_required(view):
         @wraps(view)
         def wrapped(*args, **kwargs):
             if "user_id" not in session:
                 return redirect(url_for("login"))
+            g.user = load_user(session["user_id"])
+            if g.user is None:
+                session.clear()
+                return redirect(url_for("login"))
             return view(*args, **kwargs)
 
         return wrapped
@@ -249,11 +678,6 @@ def create_app():
         try:
             if value is None or value == "":
                 return None
-            try:
-                if pd.isna(value):
-                    return None
-            except Exception:
-                pass
             if isinstance(value, str):
                 cleaned = value.replace(",", "").strip()
                 if cleaned == "":
@@ -263,30 +687,11 @@ def create_app():
         except (ValueError, TypeError):
             return None
 
-    def clean_text(value):
-        if value is None:
-            return ""
-        try:
-            if pd.isna(value):
-                return ""
-        except Exception:
-            pass
-        return str(value).strip()
-
     def extract_youtube_thumbnail(url):
-        if not url:
+        match = YOUTUBE_VIDEO_ID_RE.search(url) if url else None
+        if not match:
             return ""
-        patterns = [
-            ("watch?v=", "&"),
-            ("youtu.be/", "?"),
-            ("/shorts/", "?"),
-        ]
-        for marker, ender in patterns:
-            if marker in url:
-                video_id = url.split(marker, 1)[1].split(ender, 1)[0]
-                if video_id:
-                    return f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
-        return ""
+        return f"https://img.youtube.com/vi/{match.group(1)}/hqdefault.jpg"
 
     def fetch_thumbnail_url(url):
         if not url:
@@ -294,36 +699,39 @@ def create_app():
         youtube_thumb = extract_youtube_thumbnail(url)
         if youtube_thumb:
             return youtube_thumb
+        key = f"thumbnail:{url}"
+        thumbnail = cache_get(key)
+        if thumbnail is None:
+            thumbnail = scrape_thumbnail_url(url)
+            if thumbnail:
+                cache_set(key, thumbnail, THUMBNAIL_CACHE_TTL)
+        return thumbnail
+
+    def scrape_thumbnail_url(url):
         try:
-            response = requests.get(
+            response = HTTP.get(
                 url,
                 timeout=5,
                 headers={"User-Agent": "Mozilla/5.0"},
             )
             if response.status_code != 200:
                 return ""
-            soup = BeautifulSoup(response.text, "html.parser")
-            og_image = soup.find("meta", property="og:image")
-            if og_image and og_image.get("content"):
-                return og_image["content"].strip()
+            og_image = OG_IMAGE_TAG_RE.search(response.content)
+            content = og_image and META_CONTENT_RE.search(og_image.group(0))
+            if content:
+                return html.unescape(content.group(1).decode("utf-8", "replace")).strip()
         except Exception:
             return ""
         return ""
 
+    @lru_cache(maxsize=4096)
     def extract_instagram_username(url):
-        if not url:
-            return ""
-        if "instagram.com" not in url:
+        match = INSTAGRAM_USERNAME_RE.search(url) if url else None
+        if not match or match.group(1) in INSTAGRAM_RESERVED_PATHS:
             return ""
-        cleaned = url.split("instagram.com/", 1)[1]
-        cleaned = cleaned.split("?", 1)[0].strip("/")
-        if not cleaned:
-            return ""
-        first = cleaned.split("/", 1)[0]
-        if first in {"p", "reel", "tv", "stories", "explore"}:
-            return ""
-        return first
+        return match.group(1)
 
+    @cached_search("YouTube", DISCOVER_CACHE_TTL)
     def search_youtube_channels(query, limit):
         api_key = os.environ.get("YOUTUBE_API_KEY", "").strip()
         if not api_key:
@@ -340,7 +748,7 @@ def create_app():
         }
         url = f"https://www.googleapis.com/youtube/v3/search?{urlencode(params)}"
         try:
-            response = requests.get(url, timeout=8)
+            response = API_HTTP.get(url, timeout=8)
             response.raise_for_status()
             data = response.json()
         except Exception:
@@ -363,7 +771,7 @@ def create_app():
             }
             stats_url = f"https://www.googleapis.com/youtube/v3/channels?{urlencode(stats_params)}"
             try:
-                stats_response = requests.get(stats_url, timeout=8)
+                stats_response = API_HTTP.get(stats_url, timeout=8)
                 stats_response.raise_for_status()
                 stats_data = stats_response.json()
                 for item in stats_data.get("items", []):
@@ -388,6 +796,7 @@ def create_app():
             )
         return {"error": "", "items": items}
 
+    @cached_search("Instagram", DISCOVER_CACHE_TTL)
     def search_instagram_profiles(query, limit):
         serpapi_key = os.environ.get("SERPAPI_KEY", "").strip()
         if not serpapi_key:
@@ -403,7 +812,7 @@ def create_app():
         }
         url = f"https://serpapi.com/search.json?{urlencode(params)}"
         try:
-            response = requests.get(url, timeout=10)
+            response = API_HTTP.get(url, timeout=10)
             response.raise_for_status()
             data = response.json()
         except Exception:
@@ -432,37 +841,49 @@ def create_app():
         return {"error": "", "items": items}
 
     def normalize_columns(df):
-        mapping = {
-            "인플루언서ID": "influencer_id",
-            "플랫폼": "platform",
-            "카테고리(대)": "category_main",
-            "카테고리(소)": "category_sub",
-            "이름/계정명": "account_name",
-            "프로필URL": "profile_url",
-            "인스타그램아이디": "instagram_username",
-            "컨택이메일": "contact_email",
-            "에이전시/소속": "agency",
-            "팔로워/구독자(원본)": "followers_raw",
-            "팔로워/구독자(숫자)": "followers_num",
-            "팔로워 구간": "follower_range",
-            "영상 활용도(高/中/低)": "video_usage",
-            "2030 타깃 적합도(1~5)": "target_2030_score",
-            "단가_BDC": "price_bdc",
-            "단가_PPL": "price_ppl",
-            "단가_Short/Shorts": "price_short",
-            "단가_IG": "price_ig",
-            "썸네일": "thumbnail_url",
-            "DM문구": "dm_message",
-            "비고": "notes",
-            "계정명": "account_name",
-            "카테고리": "category_main",
-            "주요 콘텐츠": "category_sub",
-            "감성 키워드": "notes",
-        }
-        normalized = {}
-        for col in df.columns:
-            normalized[col] = mapping.get(col, col)
-        return df.rename(columns=normalized)
+        return df.rename(columns=IMPORT_COLUMN_MAP)
+
+    def clean_import_frame(df):
+        import numpy as np
+        import pandas as pd
+
+        df = df.copy()
+        for col in COLUMN_LABELS:
+            if col not in df.columns:
+                df[col] = None
+            if col in INT_COLUMNS:
+                values = df[col]
+                if not pd.api.types.is_numeric_dtype(values):
+                    values = values.astype(str).str.replace(",", "", regex=False).str.strip()
+                numbers = pd.to_numeric(values, errors="coerce")
+                numbers = np.trunc(numbers.where(np.isfinite(numbers))).astype("Int64")
+                df[col] = numbers.astype(object).where(numbers.notna(), None)
+            else:
+                df[col] = df[col].astype("string").fillna("").str.strip()
+        df["instagram_username"] = df["instagram_username"].where(
+            df["instagram_username"].ne(""),
+            df["profile_url"].map(extract_instagram_username),
+        )
+        return df
+
+    def import_chunk(conn, is_postgres, df, fetch_thumbnails, now):
+        df = df.loc[:, ~df.columns.duplicated()]
+        df = df.dropna(subset=["account_name"])
+        df = clean_import_frame(df)
+        df = df[df["account_name"].ne("")]
+        if fetch_thumbnails:
+            missing = df["thumbnail_url"].eq("") & df["profile_url"].ne("")
+            with ThreadPoolExecutor(max_workers=THUMBNAIL_FETCH_WORKERS) as pool:
+                thumbnails = list(
+                    pool.map(fetch_thumbnail_url, df.loc[missing, "profile_url"])
+                )
+            df.loc[missing, "thumbnail_url"] = thumbnails
+        records = [
+            row + (now, now)
+            for row in df[list(COLUMNS)].itertuples(index=False, name=None)
+        ]
+        save_influencers_bulk(conn, is_postgres, records)
+        return len(records)
 
     def build_filters_from_values(
         q,
@@ -479,17 +900,20 @@ def create_app():
 
         where = []
         params = []
-        if q:
+        if q and PG_POOL is not None:
+            where.append(f"({PG_SEARCH_EXPR}) ILIKE ?")
+            params.append(f"%{q}%")
+        elif q and SQLITE_FTS_ENABLED and len(q) >= FTS_MIN_QUERY_LENGTH:
+            where.append(
+                "id IN (SELECT rowid FROM influencers_fts WHERE influencers_fts MATCH ?)"
+            )
+            params.append('"' + q.replace('"', '""') + '"')
+        elif q:
             like = f"%{q}%"
             where.append(
-                "("
-                "influencer_id LIKE ? OR account_name LIKE ? OR platform LIKE ? OR "
-                "category_main LIKE ? OR category_sub LIKE ? OR profile_url LIKE ? OR "
-                "instagram_username LIKE ? OR contact_email LIKE ? OR agency LIKE ? OR "
-                "follower_range LIKE ? OR dm_message LIKE ? OR notes LIKE ?"
-                ")"
+                "(" + " OR ".join(f"{col} LIKE ?" for col in SEARCH_COLUMNS) + ")"
             )
-            params.extend([like] * 12)
+            params.extend([like] * len(SEARCH_COLUMNS))
         if platform:
             where.append("platform = ?")
             params.append(platform)
@@ -520,6 +944,26 @@ def create_app():
             "selected_columns": selected_columns,
         }
 
+    def filter_options(conn, is_postgres):
+        options = cache_get(FILTER_OPTIONS_KEY)
+        if options is None:
+            cursor = (
+                conn.cursor(cursor_factory=psycopg2.extensions.cursor)
+                if is_postgres
+                else conn.cursor()
+            )
+            cursor.execute(f"SELECT DISTINCT {', '.join(FILTER_COLUMNS)} FROM influencers")
+            values = list(zip(*cursor.fetchall())) or [()] * len(FILTER_COLUMNS)
+            options = {
+                column: sorted(set(filter(None, column_values)))
+                for column, column_values in zip(FILTER_COLUMNS, values)
+            }
+            cache_set(FILTER_OPTIONS_KEY, options, FILTER_OPTIONS_TTL)
+        return options
+
+    def invalidate_filter_options():
+        cache_delete(FILTER_OPTIONS_KEY)
+
     def build_filters(req):
         return build_filters_from_values(
             req.args.get("q", ""),
@@ -529,6 +973,16 @@ def create_app():
             req.args.get("columns", ""),
         )
 
+    def parse_page(req):
+        try:
+            return min(max(1, int(req.args.get("page", "1"))), MAX_PAGE)
+        except ValueError:
+            return 1
+
+    def page_url(page):
+        args = {**request.args.to_dict(flat=False), "page": page}
+        return f"{request.path}?{urlencode(args, doseq=True)}"
+
     @app.route("/login", methods=["GET", "POST"])
     def login():
         if request.method == "POST":
@@ -541,15 +995,17 @@ def create_app():
             user = run_query(
                 conn,
                 is_postgres,
-                "SELECT id, password_hash FROM users WHERE username = ?",
+                "SELECT id, username, password_hash FROM users WHERE username = ?",
                 (username,),
                 fetch_one=True,
             )
-            conn.close()
             if not user or not check_password_hash(user["password_hash"], password):
                 flash("로그인 정보가 올바르지 않습니다.")
                 return render_template("login.html")
+            if REDIS is not None:
+                app.session_interface.regenerate(session)
             session["user_id"] = user["id"]
+            cache_user(user)
             return redirect(url_for("index"))
         return render_template("login.html")
 
@@ -558,105 +1014,54 @@ def create_app():
         session.clear()
         return redirect(url_for("login"))
 
-    @app.route("/")
-    @login_required
-    def index():
+    def render_listing(template):
         filters = build_filters(request)
+        page = parse_page(request)
+        columns_sql = ", ".join(
+            dict.fromkeys(LISTING_COLUMNS + tuple(filters["selected_columns"]))
+        )
         conn, is_postgres = get_db()
         influencers = run_query(
             conn,
             is_postgres,
             f"""
-            SELECT * FROM influencers
+            SELECT {columns_sql} FROM influencers
             {filters["where_clause"]}
-            ORDER BY updated_at DESC
+            ORDER BY updated_at DESC, id DESC
+            LIMIT ? OFFSET ?
             """,
-            filters["params"],
-            fetch_all=True,
-        )
-        platforms = run_query(
-            conn,
-            is_postgres,
-            "SELECT DISTINCT platform FROM influencers WHERE platform IS NOT NULL AND platform != ''",
-            fetch_all=True,
-        )
-        categories = run_query(
-            conn,
-            is_postgres,
-            "SELECT DISTINCT category_main FROM influencers WHERE category_main IS NOT NULL AND category_main != ''",
+            filters["params"] + [PAGE_SIZE + 1, (page - 1) * PAGE_SIZE],
             fetch_all=True,
         )
-        sub_categories = run_query(
-            conn,
-            is_postgres,
-            "SELECT DISTINCT category_sub FROM influencers WHERE category_sub IS NOT NULL AND category_sub != ''",
-            fetch_all=True,
-        )
-        conn.close()
+        has_next = len(influencers) > PAGE_SIZE
+        options = filter_options(conn, is_postgres)
         return render_template(
-            "index.html",
-            influencers=influencers,
+            template,
+            influencers=influencers[:PAGE_SIZE],
+            page=page,
+            prev_url=page_url(page - 1) if page > 1 else None,
+            next_url=page_url(page + 1) if has_next else None,
             q=filters["q"],
             platform=filters["platform"],
             category_main=filters["category_main"],
             category_sub=filters["category_sub"],
-            platforms=[p["platform"] for p in platforms],
-            categories=[c["category_main"] for c in categories],
-            sub_categories=[c["category_sub"] for c in sub_categories],
+            platforms=options["platform"],
+            categories=options["category_main"],
+            sub_categories=options["category_sub"],
             all_columns=filters["all_columns"],
             selected_columns=filters["selected_columns"],
             column_labels=COLUMN_LABELS,
         )
 
+    @app.route("/")
+    @login_required
+    def index():
+        return render_listing("index.html")
+
     @app.route("/search")
     @login_required
     def search():
-        filters = build_filters(request)
-        conn, is_postgres = get_db()
-        influencers = run_query(
-            conn,
-            is_postgres,
-            f"""
-            SELECT * FROM influencers
-            {filters["where_clause"]}
-            ORDER BY updated_at DESC
-            """,
-            filters["params"],
-            fetch_all=True,
-        )
-        platforms = run_query(
-            conn,
-            is_postgres,
-            "SELECT DISTINCT platform FROM influencers WHERE platform IS NOT NULL AND platform != ''",
-            fetch_all=True,
-        )
-        categories = run_query(
-            conn,
-            is_postgres,
-            "SELECT DISTINCT category_main FROM influencers WHERE category_main IS NOT NULL AND category_main != ''",
-            fetch_all=True,
-        )
-        sub_categories = run_query(
-            conn,
-            is_postgres,
-            "SELECT DISTINCT category_sub FROM influencers WHERE category_sub IS NOT NULL AND category_sub != ''",
-            fetch_all=True,
-        )
-        conn.close()
-        return render_template(
-            "search.html",
-            influencers=influencers,
-            q=filters["q"],
-            platform=filters["platform"],
-            category_main=filters["category_main"],
-            category_sub=filters["category_sub"],
-            platforms=[p["platform"] for p in platforms],
-            categories=[c["category_main"] for c in categories],
-            sub_categories=[c["category_sub"] for c in sub_categories],
-            all_columns=filters["all_columns"],
-            selected_columns=filters["selected_columns"],
-            column_labels=COLUMN_LABELS,
-        )
+        return render_listing("search.html")
 
     @app.route("/discover", methods=["GET"])
     @login_required
@@ -664,6 +1069,7 @@ def create_app():
         query = request.args.get("q", "").strip()
         platform = request.args.get("platform", "").strip()
         limit = request.args.get("limit", "").strip()
+        use_cache = request.args.get("nocache") != "1"
         try:
             limit_value = int(limit) if limit else DEFAULT_DISCOVER_LIMIT
         except ValueError:
@@ -673,18 +1079,23 @@ def create_app():
         results = []
         errors = []
 
-        if query:
-            if platform in {"", "YouTube"}:
-                yt = search_youtube_channels(query, limit_value)
-                if yt["error"]:
-                    errors.append(yt["error"])
-                results.extend(yt["items"])
-
-            if platform in {"", "Instagram"}:
-                ig = search_instagram_profiles(query, limit_value)
-                if ig["error"]:
-                    errors.append(ig["error"])
-                results.extend(ig["items"])
+        searches = []
+        if query and platform in {"", "YouTube"}:
+            searches.append(search_youtube_channels)
+        if query and platform in {"", "Instagram"}:
+            searches.append(search_instagram_profiles)
+        if searches:
+            with ThreadPoolExecutor(max_workers=len(searches)) as pool:
+                responses = list(
+                    pool.map(
+                        lambda search_fn: search_fn(query, limit_value, use_cache),
+                        searches,
+                    )
+                )
+            for response in responses:
+                if response["error"]:
+                    errors.append(response["error"])
+                results.extend(response["items"])
 
         return render_template(
             "discover.html",
@@ -700,7 +1111,7 @@ def create_app():
     def new():
         if request.method == "POST":
             form = extract_form(request)
-            save_influencer(form)
+            upsert_influencer(form)
             flash("새 인플루언서를 추가했습니다.")
             return redirect(url_for("index"))
         return render_template("edit.html", influencer=None)
@@ -716,12 +1127,11 @@ def create_app():
             (influencer_id,),
             fetch_one=True,
         )
-        conn.close()
         if not influencer:
             abort(404)
         if request.method == "POST":
             form = extract_form(request)
-            update_influencer(influencer_id, form)
+            upsert_influencer(form, influencer_id)
             flash("수정이 저장되었습니다.")
             return redirect(url_for("index"))
         return render_template("edit.html", influencer=influencer)
@@ -737,7 +1147,7 @@ def create_app():
             (influencer_id,),
         )
         conn.commit()
-        conn.close()
+        invalidate_filter_options()
         flash("삭제되었습니다.")
         return redirect(url_for("index"))
 
@@ -747,7 +1157,7 @@ def create_app():
         conn, is_postgres = get_db()
         run_query(conn, is_postgres, "DELETE FROM influencers")
         conn.commit()
-        conn.close()
+        invalidate_filter_options()
         flash("전체 목록이 삭제되었습니다.")
         return redirect(url_for("index"))
 
@@ -761,93 +1171,37 @@ def create_app():
                 flash("엑셀 파일을 선택해 주세요.")
                 return redirect(url_for("import_excel"))
             try:
-                df = pd.read_excel(file)
+                workbook = openpyxl.load_workbook(file.stream, read_only=True, data_only=True)
+                rows = workbook.active.iter_rows(values_only=True)
+                header = [
+                    col if col is not None else f"Unnamed: {i}"
+                    for i, col in enumerate(next(rows, None) or ())
+                ]
             except Exception:
                 flash("엑셀 파일을 읽을 수 없습니다. 파일 형식을 확인해 주세요.")
                 return redirect(url_for("import_excel"))
 
-            df = normalize_columns(df)
-            if "account_name" not in df.columns:
+            if "account_name" not in {IMPORT_COLUMN_MAP.get(col, col) for col in header}:
+                workbook.close()
                 flash("필수 컬럼(이름/계정명)이 없습니다.")
                 return redirect(url_for("import_excel"))
 
-            df = df.dropna(subset=["account_name"])
-            rows = 0
+            import pandas as pd
+
+            imported = 0
+            now = datetime.utcnow().isoformat()
             conn, is_postgres = get_db()
-            for _, row in df.iterrows():
-                data = {
-                    "influencer_id": clean_text(row.get("influencer_id")),
-                    "platform": clean_text(row.get("platform")),
-                    "category_main": clean_text(row.get("category_main")),
-                    "category_sub": clean_text(row.get("category_sub")),
-                    "account_name": clean_text(row.get("account_name")),
-                    "profile_url": clean_text(row.get("profile_url")),
-                    "instagram_username": clean_text(row.get("instagram_username")),
-                    "contact_email": clean_text(row.get("contact_email")),
-                    "agency": clean_text(row.get("agency")),
-                    "followers_raw": clean_text(row.get("followers_raw")),
-                    "followers_num": coerce_int(row.get("followers_num")),
-                    "follower_range": clean_text(row.get("follower_range")),
-                    "video_usage": clean_text(row.get("video_usage")),
-                    "target_2030_score": coerce_int(row.get("target_2030_score")),
-                    "price_bdc": clean_text(row.get("price_bdc")),
-                    "price_ppl": clean_text(row.get("price_ppl")),
-                    "price_short": clean_text(row.get("price_short")),
-                    "price_ig": clean_text(row.get("price_ig")),
-                    "thumbnail_url": clean_text(row.get("thumbnail_url")),
-                    "dm_message": clean_text(row.get("dm_message")),
-                    "notes": clean_text(row.get("notes")),
-                }
-                if not data["instagram_username"] and data["profile_url"]:
-                    data["instagram_username"] = extract_instagram_username(
-                        data["profile_url"]
-                    )
-                if fetch_thumbnails and not data["thumbnail_url"] and data["profile_url"]:
-                    data["thumbnail_url"] = fetch_thumbnail_url(data["profile_url"])
-                if not data["account_name"]:
-                    continue
-                run_query(
-                    conn,
-                    is_postgres,
-                    """
-                    INSERT INTO influencers (
-                        influencer_id, platform, category_main, category_sub,
-                        account_name, profile_url, instagram_username, contact_email, agency,
-                        followers_raw, followers_num, follower_range, video_usage,
-                        target_2030_score, price_bdc, price_ppl, price_short, price_ig,
-                        thumbnail_url, dm_message, notes, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        data["influencer_id"],
-                        data["platform"],
-                        data["category_main"],
-                        data["category_sub"],
-                        data["account_name"],
-                        data["profile_url"],
-                        data["instagram_username"],
-                        data["contact_email"],
-                        data["agency"],
-                        data["followers_raw"],
-                        data["followers_num"],
-                        data["follower_range"],
-                        data["video_usage"],
-                        data["target_2030_score"],
-                        data["price_bdc"],
-                        data["price_ppl"],
-                        data["price_short"],
-                        data["price_ig"],
-                        data["thumbnail_url"],
-                        data["dm_message"],
-                        data["notes"],
-                        datetime.utcnow().isoformat(),
-                        datetime.utcnow().isoformat(),
-                    ),
-                )
-                rows += 1
-            conn.commit()
-            conn.close()
-            flash(f"{rows}건을 가져왔습니다.")
+            try:
+                while True:
+                    chunk = [row[: len(header)] for row in islice(rows, IMPORT_CHUNK_SIZE)]
+                    if not chunk:
+                        break
+                    df = normalize_columns(pd.DataFrame(chunk, columns=header))
+                    imported += import_chunk(conn, is_postgres, df, fetch_thumbnails, now)
+            finally:
+                workbook.close()
+            invalidate_filter_options()
+            flash(f"{imported}건을 가져왔습니다.")
             return redirect(url_for("index"))
         return render_template("import.html")
 
@@ -871,22 +1225,15 @@ def create_app():
             return redirect(url_for("index"))
 
         conn, is_postgres = get_db()
-        count_row = run_query(
-            conn,
-            is_postgres,
-            f"SELECT COUNT(*) as cnt FROM influencers {filters['where_clause']}",
-            filters["params"],
-            fetch_one=True,
-        )
-        count = count_row["cnt"] if isinstance(count_row, dict) else count_row[0]
-        run_query(
+        if is_postgres:
+            run_query(conn, is_postgres, "SET LOCAL synchronous_commit = off")
+        count = run_query(
             conn,
             is_postgres,
             f"UPDATE influencers SET dm_message = ? {filters['where_clause']}",
             [dm_template] + filters["params"],
         )
         conn.commit()
-        conn.close()
         flash(f"{count}건에 DM 문구를 적용했습니다.")
         return redirect(url_for("index"))
 
@@ -899,9 +1246,11 @@ def create_app():
             flash("내보낼 컬럼을 선택해 주세요.")
             return redirect(url_for("index"))
 
-        columns_sql = ", ".join(selected_columns)
+        columns_sql = ", ".join(
+            f'{col} AS "{COLUMN_LABELS.get(col, col)}"' for col in selected_columns
+        )
         conn, is_postgres = get_db()
-        rows = run_query(
+        rows = run_query_iter(
             conn,
             is_postgres,
             f"""
@@ -910,170 +1259,138 @@ def create_app():
             ORDER BY updated_at DESC
             """,
             filters["params"],
-            fetch_all=True,
+            header=True,
         )
-        conn.close()
 
-        data = []
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
         for row in rows:
-            item = {}
-            for col in selected_columns:
-                item[COLUMN_LABELS.get(col, col)] = row[col]
-            data.append(item)
-
-        df = pd.DataFrame(data)
-        output = BytesIO()
-        df.to_excel(output, index=False)
+            sheet.append(row)
+        output = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+        archive = ZipFile(
+            output, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=EXPORT_COMPRESS_LEVEL
+        )
+        ExcelWriter(workbook, archive).save()
         output.seek(0)
-        filename = f"influencers_{datetime.utcnow().date().isoformat()}.xlsx"
+        filename = f"influencers_{utc_date(int(time.time() // 60))}.xlsx"
         return send_file(
             output,
             as_attachment=True,
             download_name=filename,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            mimetype=XLSX_MIMETYPE,
         )
 
     def extract_form(req):
+        get = req.form.get
         return {
-            "influencer_id": req.form.get("influencer_id", "").strip(),
-            "platform": req.form.get("platform", "").strip(),
-            "category_main": req.form.get("category_main", "").strip(),
-            "category_sub": req.form.get("category_sub", "").strip(),
-            "account_name": req.form.get("account_name", "").strip(),
-            "profile_url": req.form.get("profile_url", "").strip(),
-            "instagram_username": req.form.get("instagram_username", "").strip(),
-            "contact_email": req.form.get("contact_email", "").strip(),
-            "agency": req.form.get("agency", "").strip(),
-            "followers_raw": req.form.get("followers_raw", "").strip(),
-            "followers_num": coerce_int(req.form.get("followers_num")),
-            "follower_range": req.form.get("follower_range", "").strip(),
-            "video_usage": req.form.get("video_usage", "").strip(),
-            "target_2030_score": coerce_int(req.form.get("target_2030_score")),
-            "price_bdc": req.form.get("price_bdc", "").strip(),
-            "price_ppl": req.form.get("price_ppl", "").strip(),
-            "price_short": req.form.get("price_short", "").strip(),
-            "price_ig": req.form.get("price_ig", "").strip(),
-            "thumbnail_url": req.form.get("thumbnail_url", "").strip(),
-            "dm_message": req.form.get("dm_message", "").strip(),
-            "notes": req.form.get("notes", "").strip(),
+            col: coerce_int(get(col)) if col in INT_COLUMNS else get(col, "").strip()
+            for col in COLUMNS
         }
 
-    def save_influencer(data):
+    def upsert_influencer(data, influencer_id=None):
         now = datetime.utcnow().isoformat()
         if not data.get("instagram_username") and data.get("profile_url"):
             data["instagram_username"] = extract_instagram_username(
                 data["profile_url"]
             )
-        if not data.get("thumbnail_url") and data.get("profile_url"):
-            data["thumbnail_url"] = fetch_thumbnail_url(data["profile_url"])
+        if not data.get("thumbnail_url"):
+            data["thumbnail_url"] = extract_youtube_thumbnail(data.get("profile_url"))
         conn, is_postgres = get_db()
-        run_query(
+        id_value = (
+            "COALESCE(?::integer, nextval(pg_get_serial_sequence('influencers', 'id')))"
+            if is_postgres
+            else "?"
+        )
+        row = run_prepared(
             conn,
             is_postgres,
-            """
-            INSERT INTO influencers (
-                influencer_id, platform, category_main, category_sub,
-                account_name, profile_url, instagram_username, contact_email, agency,
-                followers_raw, followers_num, follower_range, video_usage,
-                target_2030_score, price_bdc, price_ppl, price_short, price_ig,
-                thumbnail_url, dm_message, notes, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["influencer_id"],
-                data["platform"],
-                data["category_main"],
-                data["category_sub"],
-                data["account_name"],
-                data["profile_url"],
-                data["instagram_username"],
-                data["contact_email"],
-                data["agency"],
-                data["followers_raw"],
-                data["followers_num"],
-                data["follower_range"],
-                data["video_usage"],
-                data["target_2030_score"],
-                data["price_bdc"],
-                data["price_ppl"],
-                data["price_short"],
-                data["price_ig"],
-                data["thumbnail_url"],
-                data["dm_message"],
-                data["notes"],
-                now,
-                now,
-            ),
+            "upsert_influencer",
+            UPSERT_SQL.format(id_value=id_value),
+            (influencer_id, *(data[col] for col in COLUMNS), now, now),
+            fetch_one=True,
         )
         conn.commit()
-        conn.close()
+        invalidate_filter_options()
+        if not data["thumbnail_url"] and data["profile_url"]:
+            EXECUTOR.submit(backfill_thumbnail, row["id"], data["profile_url"])
 
-    def update_influencer(influencer_id, data):
-        now = datetime.utcnow().isoformat()
-        if not data.get("instagram_username") and data.get("profile_url"):
-            data["instagram_username"] = extract_instagram_username(
-                data["profile_url"]
+    def backfill_thumbnail(influencer_id, profile_url):
+        thumbnail = fetch_thumbnail_url(profile_url)
+        if not thumbnail:
+            return
+        conn, is_postgres = acquire_db()
+        try:
+            run_query(
+                conn,
+                is_postgres,
+                """
+                UPDATE influencers SET thumbnail_url = ?
+                WHERE id = ? AND profile_url = ? AND COALESCE(thumbnail_url, '') = ''
+                """,
+                (thumbnail, influencer_id, profile_url),
+            )
+            conn.commit()
+        finally:
+            release_db(conn, is_postgres)
+
+    def save_influencers_bulk(conn, is_postgres, records):
+        if not records:
+            return
+        if is_postgres:
+            execute_values(
+                conn.cursor(), INSERT_SQL + "%s", records, page_size=IMPORT_PAGE_SIZE
             )
-        if not data.get("thumbnail_url") and data.get("profile_url"):
-            data["thumbnail_url"] = fetch_thumbnail_url(data["profile_url"])
+        else:
+            conn.executemany(INSERT_SQL + INSERT_ROW_PLACEHOLDERS, records)
+        conn.commit()
+
+    @app.cli.command("refresh-thumbnails")
+    @click.option("--q", default="")
+    @click.option("--platform", default="")
+    @click.option("--category-main", default="")
+    @click.option("--category-sub", default="")
+    def refresh_thumbnails(q, platform, category_main, category_sub):
+        filters = build_filters_from_values(q, platform, category_main, category_sub, "")
+        missing = "COALESCE(thumbnail_url, '') = '' AND COALESCE(profile_url, '') <> ''"
+        where_clause = (
+            f"{filters['where_clause']} AND {missing}"
+            if filters["where_clause"]
+            else f"WHERE {missing}"
+        )
         conn, is_postgres = get_db()
-        run_query(
+        rows = run_query(
             conn,
             is_postgres,
-            """
-            UPDATE influencers SET
-                influencer_id = ?,
-                platform = ?,
-                category_main = ?,
-                category_sub = ?,
-                account_name = ?,
-                profile_url = ?,
-                instagram_username = ?,
-                contact_email = ?,
-                agency = ?,
-                followers_raw = ?,
-                followers_num = ?,
-                follower_range = ?,
-                video_usage = ?,
-                target_2030_score = ?,
-                price_bdc = ?,
-                price_ppl = ?,
-                price_short = ?,
-                price_ig = ?,
-                thumbnail_url = ?,
-                dm_message = ?,
-                notes = ?,
-                updated_at = ?
-            WHERE id = ?
-            """,
-            (
-                data["influencer_id"],
-                data["platform"],
-                data["category_main"],
-                data["category_sub"],
-                data["account_name"],
-                data["profile_url"],
-                data["instagram_username"],
-                data["contact_email"],
-                data["agency"],
-                data["followers_raw"],
-                data["followers_num"],
-                data["follower_range"],
-                data["video_usage"],
-                data["target_2030_score"],
-                data["price_bdc"],
-                data["price_ppl"],
-                data["price_short"],
-                data["price_ig"],
-                data["thumbnail_url"],
-                data["dm_message"],
-                data["notes"],
-                now,
-                influencer_id,
-            ),
+            f"SELECT id, profile_url FROM influencers {where_clause}",
+            filters["params"],
+            fetch_all=True,
         )
-        conn.commit()
-        conn.close()
+        with ThreadPoolExecutor(max_workers=THUMBNAIL_FETCH_WORKERS) as pool:
+            thumbnails = pool.map(fetch_thumbnail_url, [row["profile_url"] for row in rows])
+            pairs = [
+                (row["id"], thumbnail)
+                for row, thumbnail in zip(rows, thumbnails)
+                if thumbnail
+            ]
+        if pairs:
+            if is_postgres:
+                execute_values(
+                    conn.cursor(),
+                    """
+                    UPDATE influencers SET thumbnail_url = data.thumb
+                    FROM (VALUES %s) AS data(id, thumb)
+                    WHERE influencers.id = data.id
+                    """,
+                    pairs,
+                    page_size=IMPORT_PAGE_SIZE,
+                )
+            else:
+                conn.executemany(
+                    "UPDATE influencers SET thumbnail_url = ? WHERE id = ?",
+                    [(thumbnail, influencer_id) for influencer_id, thumbnail in pairs],
+                )
+            conn.commit()
+        click.echo(f"썸네일 {len(pairs)}/{len(rows)}건을 갱신했습니다.")
 
     return app
 